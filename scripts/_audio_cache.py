@@ -0,0 +1,51 @@
+"""
+Content-addressable cache of generated audio
+
+A clip is fully determined by (provider, voice, model, language, text),
+so identical stimuli - repeated phrases across categories, or reruns
+after outputs/ is cleared - can be served from disk instead of paying
+another API round trip and vendor charge.
+"""
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import Optional
+
+_CACHE_ROOT = Path(".tts-eval-cache/audio")
+
+
+def cache_key(provider: str, voice_id: str, model_id: str,
+              language: str, text: str) -> str:
+    """Digest of everything that determines the synthesized audio"""
+    raw = f"{provider}|{voice_id}|{model_id}|{language}|{text}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _cache_path(key: str) -> Path:
+    # Two-level fan-out keeps directory listings short
+    return _CACHE_ROOT / key[:2] / f"{key}.mp3"
+
+
+def get(key: str) -> Optional[Path]:
+    """Path to the cached clip, or None on a miss"""
+    path = _cache_path(key)
+    try:
+        if path.stat().st_size > 0:
+            return path
+    except OSError:
+        pass
+    return None
+
+
+def put(key: str, source: Path):
+    """Store a generated clip; best-effort, never raises"""
+    path = _cache_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        shutil.copyfile(source, tmp)
+        os.replace(tmp, path)
+    except OSError:
+        pass
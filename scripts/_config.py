@@ -0,0 +1,31 @@
+"""
+Shared config.yaml loader
+Parses the config once per process and reuses the C loader when available
+"""
+
+import functools
+
+
+@functools.lru_cache(maxsize=1)
+def load_config(path: str = "config.yaml") -> dict:
+    """
+    Load and cache config.yaml
+
+    Uses libyaml's CSafeLoader when installed (~10x faster than the
+    pure-Python loader) and opens in binary mode so libyaml skips the
+    Python text-decode layer. Repeat calls in the same process are free.
+
+    Args:
+        path: Path to the YAML config file
+
+    Returns:
+        Parsed config dict
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=Loader)
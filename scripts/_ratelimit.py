@@ -0,0 +1,35 @@
+"""
+Shared client-side rate limiting
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket - acquire() blocks until a token frees up
+
+    Keeps a parallel batch below the account's rate limit so the server
+    never answers 429 and triggers backoff, which would serialize the
+    batch worse than running it single-threaded.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate  # tokens per second
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
@@ -6,10 +6,109 @@ TTFB measures how quickly audio streaming can begin - critical for real-time app
 """
 
 import json
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from collections import defaultdict
-import statistics
-from typing import Dict, List, Tuple
+from typing import Dict, List
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON parser, stdlib json works too
+    orjson = None
+
+# test_id prefix -> language code (e.g. "E1-H1" is English)
+_LANG_PREFIXES = (("E", "en"), ("D", "de"), ("C", "zh"), ("J", "ja"))
+
+# The only per-entry fields the latency analysis reads
+_LOG_ENTRY_KEYS = ("test_id", "status", "ttfb", "generation_time", "total_time")
+
+
+def _prune_log(log: Dict) -> Dict:
+    """Keep only the fields extraction reads, dropping text/path payloads"""
+    pruned = {}
+    for provider in ("cartesia", "elevenlabs"):
+        entries = log.get(provider)
+        if entries:
+            pruned[provider] = [
+                {key: entry[key] for key in _LOG_ENTRY_KEYS if key in entry}
+                for entry in entries
+            ]
+    return pruned
+
+
+def _coerce_float_array(raw: List) -> np.ndarray:
+    """Bulk-cast to float64; None becomes NaN, unparseable entries too"""
+    try:
+        return np.asarray(raw, dtype=np.float64)
+    except (TypeError, ValueError):
+        # Rare bad rows (e.g. a non-numeric string) - coerce item by item
+        def _safe(value):
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return np.nan
+        return np.array([_safe(value) for value in raw], dtype=np.float64)
+
+
+def _pair_columns(lat_raw: List, qual_raw: List) -> np.ndarray:
+    """Stack (latency, quality) columns, keeping only valid nonzero pairs"""
+    lat = _coerce_float_array(lat_raw)
+    qual = _coerce_float_array(qual_raw)
+    mask = ~np.isnan(lat) & ~np.isnan(qual) & (lat != 0) & (qual != 0)
+    return np.column_stack([lat[mask], qual[mask]])
+
+
+def _average_ranks(a: np.ndarray) -> np.ndarray:
+    """Rank values 1..n, assigning tied values their average rank"""
+    order = np.argsort(a, kind="stable")
+    ranks = np.empty(a.size, dtype=np.float64)
+    ranks[order] = np.arange(1, a.size + 1)
+
+    values, inverse, counts = np.unique(a, return_inverse=True, return_counts=True)
+    rank_sums = np.zeros(values.size, dtype=np.float64)
+    np.add.at(rank_sums, inverse, ranks)
+    return (rank_sums / counts)[inverse]
+
+
+def _load_json_bytes(data: bytes):
+    """Parse JSON bytes with orjson when available, stdlib json otherwise"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class OnlineStats:
+    """Welford's online mean/variance - O(1) memory per stream
+
+    Used for streams where we only report count/mean/stdev/min/max, so the
+    individual samples never need to be retained.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def update(self, x: float):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    @property
+    def stdev(self) -> float:
+        if self.count < 2:
+            return 0.0
+        return (self._m2 / (self.count - 1)) ** 0.5
 
 
 class LatencyAnalyzer:
@@ -17,112 +116,238 @@ class LatencyAnalyzer:
 
     def __init__(self, results_dir: str = "results"):
         self.results_dir = Path(results_dir)
-        self.generation_logs = []
+        self.log_count = 0
         self.evaluations = []
         self.latency_data = {"cartesia": [], "elevenlabs": []}  # TTFB data
-        self.total_time_data = {"cartesia": [], "elevenlabs": []}  # Total download time
-        self.latency_by_language = defaultdict(lambda: {"cartesia": [], "elevenlabs": []})
-
-    def load_data(self):
-        """Load generation logs and evaluations"""
-        # Load all generation logs
-        log_files = sorted(self.results_dir.glob("generation_log_*.json"))
-        for log_file in log_files:
-            with open(log_file) as f:
-                self.generation_logs.append(json.load(f))
-
-        # Load evaluations
+        self.total_time_data = {"cartesia": OnlineStats(), "elevenlabs": OnlineStats()}  # Total download time
+        # Languages form a fixed, closed set - a plain dict literal avoids the
+        # per-miss lambda call a defaultdict would make
+        self.latency_by_language = {
+            lang: {"cartesia": [], "elevenlabs": []}
+            for lang in ("en", "de", "zh", "ja", "unknown")
+        }
+        self._loaded = False
+        self._overall_stats = None  # cached per-provider TTFB stats
+        self._lang_stats = {}  # per-language stats filled by analyze_by_language
+        self._comparison = {}  # speedup/CV figures filled by compare_latency
+
+    def load_and_extract(self):
+        """Load logs and evaluations, extracting latency data in one pass
+
+        Each parsed log is released as soon as its latencies are extracted,
+        so peak memory stays at roughly one log regardless of how many runs
+        have accumulated in results/. Extracted data is cached to a pickle
+        sidecar keyed by each log's (mtime, size).
+        """
+        # Short-circuit repeated calls within the same process
+        if self._loaded:
+            return
+        self._loaded = True
+
+        # One scandir pass beats Path.glob here: no per-entry fnmatch or Path
+        # allocation, and each DirEntry carries its stat result for free
+        with os.scandir(self.results_dir) as entries:
+            log_files = sorted(
+                (entry for entry in entries
+                 if entry.name.startswith("generation_log_")
+                 and entry.name.endswith(".json")),
+                key=lambda entry: entry.name,
+            )
+        self.log_count = len(log_files)
+        if log_files:
+            cache_path = self.results_dir / ".latency_cache.pkl"
+            manifest = {
+                entry.name: (entry.stat().st_mtime_ns, entry.stat().st_size)
+                for entry in log_files
+            }
+            if not self._restore_from_cache(cache_path, manifest):
+                # Parse in parallel (orjson releases the GIL in its C parser,
+                # so threads overlap I/O and parsing) and extract immediately
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    for log in executor.map(
+                        lambda entry: _prune_log(
+                            _load_json_bytes(Path(entry.path).read_bytes())),
+                        log_files,
+                    ):
+                        self._extract_from_log(log)
+                self._finalize_arrays()
+                self._write_cache(cache_path, manifest)
+        else:
+            self._finalize_arrays()
+
+        # Load evaluations - slurp the whole file in one read; evaluations.json
+        # can grow to megabytes and chunked reads just add syscalls
         eval_file = self.results_dir / "evaluations.json"
         if eval_file.exists():
-            with open(eval_file) as f:
-                self.evaluations = json.load(f)
+            self.evaluations = _load_json_bytes(eval_file.read_bytes())
 
-        print(f"✅ Loaded {len(self.generation_logs)} generation logs")
+        print(f"✅ Loaded {self.log_count} generation logs")
         print(f"✅ Loaded {len(self.evaluations)} evaluations")
 
-    def extract_latency_data(self):
-        """Extract TTFB and total time from generation logs"""
-        for log in self.generation_logs:
-            for provider in ["cartesia", "elevenlabs"]:
-                if provider in log:
-                    for entry in log[provider]:
-                        if entry["status"] == "success":
-                            # Prefer ttfb if available, fall back to generation_time for older logs
-                            ttfb = entry.get("ttfb") or entry.get("generation_time")
-                            total_time = entry.get("total_time") or entry.get("generation_time")
-
-                            if ttfb:
-                                self.latency_data[provider].append(ttfb)
-                            if total_time:
-                                self.total_time_data[provider].append(total_time)
-
-                            # Get language from test_id or category
-                            test_id = entry.get("test_id", "")
-                            if test_id.startswith("E"):
-                                language = "en"
-                            elif test_id.startswith("D"):
-                                language = "de"
-                            elif test_id.startswith("C"):
-                                language = "zh"
-                            elif test_id.startswith("J"):
-                                language = "ja"
-                            else:
-                                language = "unknown"
-
-                            if ttfb:
-                                self.latency_by_language[language][provider].append(ttfb)
-
         print(f"\n📊 TTFB data points:")
         print(f"   Cartesia: {len(self.latency_data['cartesia'])}")
         print(f"   ElevenLabs: {len(self.latency_data['elevenlabs'])}")
 
+    def _restore_from_cache(self, cache_path: Path, manifest: Dict) -> bool:
+        """Restore extracted latency data if the manifest still matches"""
+        if not cache_path.exists():
+            return False
+        try:
+            cached = pickle.loads(cache_path.read_bytes())
+            if cached.get("manifest") != manifest:
+                return False
+            self.latency_data = cached["latency_data"]
+            self.total_time_data = cached["total_time_data"]
+            self.latency_by_language = cached["latency_by_language"]
+            return True
+        except Exception:
+            return False  # stale/corrupt cache - fall through to a fresh parse
+
+    def _write_cache(self, cache_path: Path, manifest: Dict):
+        try:
+            cache_path.write_bytes(pickle.dumps(
+                {
+                    "manifest": manifest,
+                    "latency_data": self.latency_data,
+                    "total_time_data": self.total_time_data,
+                    "latency_by_language": self.latency_by_language,
+                },
+                protocol=pickle.HIGHEST_PROTOCOL,
+            ))
+        except OSError:
+            pass  # cache is best-effort only
+
+    def _extract_from_log(self, log: Dict):
+        """Extract TTFB and total time from a single parsed generation log"""
+        for provider in ["cartesia", "elevenlabs"]:
+            if provider not in log:
+                continue
+
+            # Prefer ttfb if available, fall back to generation_time for older logs
+            rows = [
+                (entry.get("test_id", ""),
+                 entry.get("ttfb") or entry.get("generation_time"),
+                 entry.get("total_time") or entry.get("generation_time"))
+                for entry in log[provider]
+                if entry["status"] == "success"
+            ]
+
+            # Local aliases skip repeated attribute/subscript lookups in
+            # the per-entry work below
+            total_stats = self.total_time_data[provider]
+            lang_buckets = self.latency_by_language
+
+            for _, _, total_time in rows:
+                if total_time:
+                    total_stats.update(total_time)
+
+            valid = [(test_id, ttfb) for test_id, ttfb, _ in rows if ttfb]
+            if not valid:
+                continue
+
+            # Classify language by test_id prefix with one vectorized
+            # comparison per language instead of a per-entry branch chain
+            ttfb_arr = np.asarray([ttfb for _, ttfb in valid], dtype=np.float64)
+            prefixes = np.asarray([test_id[:1] for test_id, _ in valid], dtype="U1")
+            self.latency_data[provider].extend(ttfb_arr.tolist())
+
+            matched = np.zeros(len(valid), dtype=bool)
+            for prefix, language in _LANG_PREFIXES:
+                mask = prefixes == prefix
+                if mask.any():
+                    lang_buckets[language][provider].extend(ttfb_arr[mask].tolist())
+                    matched |= mask
+            if not matched.all():
+                lang_buckets["unknown"][provider].extend(ttfb_arr[~matched].tolist())
+
+    def _finalize_arrays(self):
+        # Freeze the accumulated lists into float64 arrays: ~4x less memory
+        # than lists of Python floats and contiguous for the vectorized stats
+        for provider in ("cartesia", "elevenlabs"):
+            self.latency_data[provider] = np.asarray(
+                self.latency_data[provider], dtype=np.float64)
+        for buckets in self.latency_by_language.values():
+            for provider in ("cartesia", "elevenlabs"):
+                buckets[provider] = np.asarray(buckets[provider], dtype=np.float64)
+
     def compute_statistics(self, values: List[float]) -> Dict:
-        """Compute statistical measures"""
-        if not values:
+        """Compute statistical measures in a single vectorized pass"""
+        if len(values) == 0:
             return {}
 
+        arr = np.asarray(values, dtype=np.float64)
+        # One C-level sort covers min/p25/median/p75/max
+        mn, p25, median, p75, mx = np.percentile(arr, [0, 25, 50, 75, 100])
+
+        return {
+            "count": arr.size,
+            "mean": arr.mean(),
+            "median": median,
+            "stdev": arr.std(ddof=1) if arr.size > 1 else 0,
+            "min": mn,
+            "max": mx,
+            "p25": p25 if arr.size >= 4 else None,
+            "p75": p75 if arr.size >= 4 else None,
+        }
+
+    def compute_statistics_fast(self, values) -> Dict:
+        """count/mean/stdev only - skips the percentile sort
+
+        For sections that never print percentiles (the per-language report),
+        this avoids an O(n log n) sort per provider per language.
+        """
+        if len(values) == 0:
+            return {}
+
+        arr = np.asarray(values, dtype=np.float64)
         return {
-            "count": len(values),
-            "mean": statistics.mean(values),
-            "median": statistics.median(values),
-            "stdev": statistics.stdev(values) if len(values) > 1 else 0,
-            "min": min(values),
-            "max": max(values),
-            "p25": statistics.quantiles(values, n=4)[0] if len(values) >= 4 else None,
-            "p75": statistics.quantiles(values, n=4)[2] if len(values) >= 4 else None,
+            "count": arr.size,
+            "mean": arr.mean(),
+            "stdev": arr.std(ddof=1) if arr.size > 1 else 0,
         }
 
+    def overall_statistics(self) -> Dict:
+        """Per-provider TTFB stats, computed once and reused across sections"""
+        if self._overall_stats is None:
+            self._overall_stats = {
+                provider: self.compute_statistics(values)
+                for provider, values in self.latency_data.items()
+            }
+        return self._overall_stats
+
     def compare_latency(self):
         """Compare TTFB between providers"""
-        print("\n" + "="*70)
-        print("TIME-TO-FIRST-BYTE (TTFB) COMPARISON")
-        print("="*70)
-        print("\nTTFB = time until first audio chunk arrives (critical for streaming)")
-
-        cart_stats = self.compute_statistics(self.latency_data["cartesia"])
-        elev_stats = self.compute_statistics(self.latency_data["elevenlabs"])
-
-        print("\n📈 Cartesia Sonic 3 TTFB:")
-        print(f"   Count:      {cart_stats['count']}")
-        print(f"   Mean:       {cart_stats['mean']:.3f}s")
-        print(f"   Median:     {cart_stats['median']:.3f}s")
-        print(f"   Std Dev:    {cart_stats['stdev']:.3f}s")
-        print(f"   Min:        {cart_stats['min']:.3f}s")
-        print(f"   Max:        {cart_stats['max']:.3f}s")
+        out = []  # buffered lines - one stdout write per section
+        out.append("\n" + "="*70)
+        out.append("TIME-TO-FIRST-BYTE (TTFB) COMPARISON")
+        out.append("="*70)
+        out.append("\nTTFB = time until first audio chunk arrives (critical for streaming)")
+
+        overall = self.overall_statistics()
+        cart_stats = overall["cartesia"]
+        elev_stats = overall["elevenlabs"]
+
+        out.append("\n📈 Cartesia Sonic 3 TTFB:")
+        out.append(f"   Count:      {cart_stats['count']}")
+        out.append(f"   Mean:       {cart_stats['mean']:.3f}s")
+        out.append(f"   Median:     {cart_stats['median']:.3f}s")
+        out.append(f"   Std Dev:    {cart_stats['stdev']:.3f}s")
+        out.append(f"   Min:        {cart_stats['min']:.3f}s")
+        out.append(f"   Max:        {cart_stats['max']:.3f}s")
         if cart_stats['p25']:
-            print(f"   25th %ile:  {cart_stats['p25']:.3f}s")
-            print(f"   75th %ile:  {cart_stats['p75']:.3f}s")
-
-        print("\n📈 ElevenLabs Flash v2.5 TTFB:")
-        print(f"   Count:      {elev_stats['count']}")
-        print(f"   Mean:       {elev_stats['mean']:.3f}s")
-        print(f"   Median:     {elev_stats['median']:.3f}s")
-        print(f"   Std Dev:    {elev_stats['stdev']:.3f}s")
-        print(f"   Min:        {elev_stats['min']:.3f}s")
-        print(f"   Max:        {elev_stats['max']:.3f}s")
+            out.append(f"   25th %ile:  {cart_stats['p25']:.3f}s")
+            out.append(f"   75th %ile:  {cart_stats['p75']:.3f}s")
+
+        out.append("\n📈 ElevenLabs Flash v2.5 TTFB:")
+        out.append(f"   Count:      {elev_stats['count']}")
+        out.append(f"   Mean:       {elev_stats['mean']:.3f}s")
+        out.append(f"   Median:     {elev_stats['median']:.3f}s")
+        out.append(f"   Std Dev:    {elev_stats['stdev']:.3f}s")
+        out.append(f"   Min:        {elev_stats['min']:.3f}s")
+        out.append(f"   Max:        {elev_stats['max']:.3f}s")
         if elev_stats['p25']:
-            print(f"   25th %ile:  {elev_stats['p25']:.3f}s")
-            print(f"   75th %ile:  {elev_stats['p75']:.3f}s")
+            out.append(f"   25th %ile:  {elev_stats['p25']:.3f}s")
+            out.append(f"   75th %ile:  {elev_stats['p75']:.3f}s")
 
         # Calculate speedup
         if cart_stats['mean'] and elev_stats['mean']:
@@ -130,42 +355,46 @@ class LatencyAnalyzer:
             faster = "ElevenLabs" if speedup > 1 else "Cartesia"
             speedup_pct = abs(speedup - 1) * 100
 
-            print("\n🏆 TTFB Winner:")
-            print(f"   {faster} is {speedup_pct:.1f}% faster on average")
-            print(f"   Speedup ratio: {speedup:.2f}x")
+            out.append("\n🏆 TTFB Winner:")
+            out.append(f"   {faster} is {speedup_pct:.1f}% faster on average")
+            out.append(f"   Speedup ratio: {speedup:.2f}x")
 
             # Median comparison
             median_speedup = cart_stats['median'] / elev_stats['median']
-            print(f"\n   Median speedup: {median_speedup:.2f}x")
+            out.append(f"\n   Median speedup: {median_speedup:.2f}x")
 
             # Consistency comparison
             cart_cv = cart_stats['stdev'] / cart_stats['mean']  # Coefficient of variation
             elev_cv = elev_stats['stdev'] / elev_stats['mean']
+            self._comparison = {"speedup": speedup, "cart_cv": cart_cv, "elev_cv": elev_cv}
             more_consistent = "Cartesia" if cart_cv < elev_cv else "ElevenLabs"
-            print(f"\n📊 TTFB Consistency (lower CV is better):")
-            print(f"   Cartesia CV:    {cart_cv:.3f}")
-            print(f"   ElevenLabs CV:  {elev_cv:.3f}")
-            print(f"   {more_consistent} is more consistent")
+            out.append(f"\n📊 TTFB Consistency (lower CV is better):")
+            out.append(f"   Cartesia CV:    {cart_cv:.3f}")
+            out.append(f"   ElevenLabs CV:  {elev_cv:.3f}")
+            out.append(f"   {more_consistent} is more consistent")
 
         # Also show total time comparison if available
-        cart_total = self.compute_statistics(self.total_time_data["cartesia"])
-        elev_total = self.compute_statistics(self.total_time_data["elevenlabs"])
-
-        if cart_total and elev_total and cart_total.get('mean') and elev_total.get('mean'):
-            print("\n" + "-"*50)
-            print("TOTAL DOWNLOAD TIME (for reference)")
-            print("-"*50)
-            print(f"   Cartesia:   {cart_total['mean']:.3f}s mean")
-            print(f"   ElevenLabs: {elev_total['mean']:.3f}s mean")
-            total_speedup = cart_total['mean'] / elev_total['mean']
+        cart_total = self.total_time_data["cartesia"]
+        elev_total = self.total_time_data["elevenlabs"]
+
+        if cart_total.count and elev_total.count:
+            out.append("\n" + "-"*50)
+            out.append("TOTAL DOWNLOAD TIME (for reference)")
+            out.append("-"*50)
+            out.append(f"   Cartesia:   {cart_total.mean:.3f}s mean")
+            out.append(f"   ElevenLabs: {elev_total.mean:.3f}s mean")
+            total_speedup = cart_total.mean / elev_total.mean
             faster = "ElevenLabs" if total_speedup > 1 else "Cartesia"
-            print(f"   → {faster} completes full download {abs(total_speedup-1)*100:.1f}% faster")
+            out.append(f"   → {faster} completes full download {abs(total_speedup-1)*100:.1f}% faster")
+
+        print("\n".join(out))
 
     def analyze_by_language(self):
         """Analyze TTFB by language"""
-        print("\n" + "="*70)
-        print("TTFB BY LANGUAGE")
-        print("="*70)
+        out = []  # buffered lines - one stdout write per section
+        out.append("\n" + "="*70)
+        out.append("TTFB BY LANGUAGE")
+        out.append("="*70)
 
         language_names = {
             "en": "English",
@@ -179,29 +408,33 @@ class LatencyAnalyzer:
                 continue
 
             lang_name = language_names.get(lang_code, lang_code)
-            print(f"\n🌍 {lang_name} ({lang_code}):")
+            out.append(f"\n🌍 {lang_name} ({lang_code}):")
 
             cart_latencies = self.latency_by_language[lang_code]["cartesia"]
             elev_latencies = self.latency_by_language[lang_code]["elevenlabs"]
 
-            if cart_latencies:
-                cart_stats = self.compute_statistics(cart_latencies)
-                print(f"   Cartesia:   {cart_stats['mean']:.3f}s (±{cart_stats['stdev']:.3f}s) n={cart_stats['count']}")
+            cart_stats = self.compute_statistics_fast(cart_latencies)
+            elev_stats = self.compute_statistics_fast(elev_latencies)
+            self._lang_stats[lang_code] = {"cartesia": cart_stats, "elevenlabs": elev_stats}
+
+            if cart_stats:
+                out.append(f"   Cartesia:   {cart_stats['mean']:.3f}s (±{cart_stats['stdev']:.3f}s) n={cart_stats['count']}")
             else:
-                print(f"   Cartesia:   No data")
+                out.append(f"   Cartesia:   No data")
 
-            if elev_latencies:
-                elev_stats = self.compute_statistics(elev_latencies)
-                print(f"   ElevenLabs: {elev_stats['mean']:.3f}s (±{elev_stats['stdev']:.3f}s) n={elev_stats['count']}")
+            if elev_stats:
+                out.append(f"   ElevenLabs: {elev_stats['mean']:.3f}s (±{elev_stats['stdev']:.3f}s) n={elev_stats['count']}")
             else:
-                print(f"   ElevenLabs: No data")
+                out.append(f"   ElevenLabs: No data")
 
             # Compare
-            if cart_latencies and elev_latencies:
+            if cart_stats and elev_stats:
                 speedup = cart_stats['mean'] / elev_stats['mean']
                 faster = "ElevenLabs" if speedup > 1 else "Cartesia"
                 speedup_pct = abs(speedup - 1) * 100
-                print(f"   → {faster} is {speedup_pct:.1f}% faster ({speedup:.2f}x)")
+                out.append(f"   → {faster} is {speedup_pct:.1f}% faster ({speedup:.2f}x)")
+
+        print("\n".join(out))
 
     def correlate_latency_quality(self):
         """Analyze correlation between TTFB and quality scores"""
@@ -213,68 +446,55 @@ class LatencyAnalyzer:
             print("\n⚠️  No evaluations available for correlation analysis")
             return
 
-        # Extract TTFB and quality data
-        cart_data = []  # (ttfb, quality_score)
-        elev_data = []
+        # Gather raw values first, then coerce in one C-level cast per column
+        # instead of paying try/except float() overhead per evaluation
+        def _avg_score(eval_item: Dict, provider: str):
+            sub = eval_item.get(provider)
+            return sub.get("average_score") if sub else None
 
-        for eval_item in self.evaluations:
-            test_id = eval_item["test_id"]
-
-            # Get TTFB (convert to float if string) - check ttfb first, fall back to latency for older data
-            latency_data = eval_item.get("latency", {})
-            cart_latency = latency_data.get("cartesia_ttfb") or latency_data.get("cartesia")
-            elev_latency = latency_data.get("elevenlabs_ttfb") or latency_data.get("elevenlabs")
-
-            # Convert to float if needed
-            if cart_latency is not None:
-                try:
-                    cart_latency = float(cart_latency)
-                except (ValueError, TypeError):
-                    cart_latency = None
-
-            if elev_latency is not None:
-                try:
-                    elev_latency = float(elev_latency)
-                except (ValueError, TypeError):
-                    elev_latency = None
-
-            # Get quality scores
-            cart_quality = eval_item.get("cartesia", {}).get("average_score")
-            elev_quality = eval_item.get("elevenlabs", {}).get("average_score")
-
-            if cart_latency and cart_quality:
-                cart_data.append((cart_latency, cart_quality))
-            if elev_latency and elev_quality:
-                elev_data.append((elev_latency, elev_quality))
+        empty = {}  # shared sentinel - avoids a fresh {} default per eval
+        cart_lat_raw, cart_qual_raw = [], []
+        elev_lat_raw, elev_qual_raw = [], []
 
+        for eval_item in self.evaluations:
+            # Check ttfb first, fall back to latency for older data
+            latency_data = eval_item.get("latency") or empty
+            cart_lat_raw.append(latency_data.get("cartesia_ttfb") or latency_data.get("cartesia"))
+            elev_lat_raw.append(latency_data.get("elevenlabs_ttfb") or latency_data.get("elevenlabs"))
+            cart_qual_raw.append(_avg_score(eval_item, "cartesia"))
+            elev_qual_raw.append(_avg_score(eval_item, "elevenlabs"))
+
+        # Vectorized (ttfb, quality) arrays; rows with missing, unparseable
+        # or zero values drop out via the NaN mask
+        cart_arr = _pair_columns(cart_lat_raw, cart_qual_raw)
+        elev_arr = _pair_columns(elev_lat_raw, elev_qual_raw)
         print(f"\n📊 Data points for TTFB-Quality correlation:")
-        print(f"   Cartesia:   {len(cart_data)} evaluations")
-        print(f"   ElevenLabs: {len(elev_data)} evaluations")
+        print(f"   Cartesia:   {len(cart_arr)} evaluations")
+        print(f"   ElevenLabs: {len(elev_arr)} evaluations")
 
-        # Compute correlation
-        def pearson_correlation(data: List[Tuple[float, float]]) -> float:
-            if len(data) < 2:
+        def pearson_correlation(arr: np.ndarray) -> float:
+            if arr.shape[0] < 2:
                 return 0.0
 
-            x_values = [x for x, y in data]
-            y_values = [y for x, y in data]
-
-            n = len(data)
-            mean_x = statistics.mean(x_values)
-            mean_y = statistics.mean(y_values)
+            corr = np.corrcoef(arr[:, 0], arr[:, 1])[0, 1]
+            # Degenerate (zero-variance) inputs produce NaN
+            return float(corr) if np.isfinite(corr) else 0.0
 
-            numerator = sum((x - mean_x) * (y - mean_y) for x, y in data)
-            denominator_x = sum((x - mean_x) ** 2 for x in x_values)
-            denominator_y = sum((y - mean_y) ** 2 for y in y_values)
-
-            if denominator_x == 0 or denominator_y == 0:
+        def spearman_correlation(arr: np.ndarray) -> float:
+            # Pearson on average ranks: monotonic signal, robust to the tail
+            # latencies that skew Pearson on the raw values
+            if arr.shape[0] < 2:
                 return 0.0
 
-            return numerator / (denominator_x * denominator_y) ** 0.5
+            ranks = np.column_stack(
+                [_average_ranks(arr[:, 0]), _average_ranks(arr[:, 1])])
+            return pearson_correlation(ranks)
 
-        if cart_data:
-            cart_corr = pearson_correlation(cart_data)
+        if len(cart_arr):
+            cart_corr = pearson_correlation(cart_arr)
+            cart_rho = spearman_correlation(cart_arr)
             print(f"\n🔗 Cartesia - TTFB vs Quality correlation: {cart_corr:.3f}")
+            print(f"   Spearman (rank): {cart_rho:.3f}")
             if abs(cart_corr) < 0.3:
                 print(f"   → Weak correlation (TTFB doesn't strongly affect quality)")
             elif abs(cart_corr) < 0.7:
@@ -282,9 +502,11 @@ class LatencyAnalyzer:
             else:
                 print(f"   → Strong correlation")
 
-        if elev_data:
-            elev_corr = pearson_correlation(elev_data)
+        if len(elev_arr):
+            elev_corr = pearson_correlation(elev_arr)
+            elev_rho = spearman_correlation(elev_arr)
             print(f"\n🔗 ElevenLabs - TTFB vs Quality correlation: {elev_corr:.3f}")
+            print(f"   Spearman (rank): {elev_rho:.3f}")
             if abs(elev_corr) < 0.3:
                 print(f"   → Weak correlation (TTFB doesn't strongly affect quality)")
             elif abs(elev_corr) < 0.7:
@@ -293,9 +515,9 @@ class LatencyAnalyzer:
                 print(f"   → Strong correlation")
 
         # Quality comparison
-        if cart_data and elev_data:
-            cart_avg_quality = statistics.mean([q for l, q in cart_data])
-            elev_avg_quality = statistics.mean([q for l, q in elev_data])
+        if len(cart_arr) and len(elev_arr):
+            cart_avg_quality = cart_arr[:, 1].mean()
+            elev_avg_quality = elev_arr[:, 1].mean()
 
             print(f"\n📊 Average Quality Scores (1-5 scale):")
             print(f"   Cartesia:   {cart_avg_quality:.2f}")
@@ -310,56 +532,64 @@ class LatencyAnalyzer:
 
     def generate_summary(self):
         """Generate executive summary"""
-        print("\n" + "="*70)
-        print("EXECUTIVE SUMMARY")
-        print("="*70)
+        out = []  # buffered lines - one stdout write per section
+        out.append("\n" + "="*70)
+        out.append("EXECUTIVE SUMMARY")
+        out.append("="*70)
 
-        cart_stats = self.compute_statistics(self.latency_data["cartesia"])
-        elev_stats = self.compute_statistics(self.latency_data["elevenlabs"])
+        overall = self.overall_statistics()
+        cart_stats = overall["cartesia"]
+        elev_stats = overall["elevenlabs"]
 
         if cart_stats and elev_stats:
-            speedup = cart_stats['mean'] / elev_stats['mean']
+            # Reuse the figures compare_latency already derived
+            speedup = self._comparison.get("speedup",
+                                           cart_stats['mean'] / elev_stats['mean'])
 
-            print("\n🎯 Key Findings (TTFB = Time-to-First-Byte):")
-            print()
+            out.append("\n🎯 Key Findings (TTFB = Time-to-First-Byte):")
+            out.append("")
 
             if speedup > 1.1:
-                print(f"1. ⚡ ElevenLabs Flash v2.5 TTFB is {(speedup-1)*100:.1f}% FASTER than Cartesia Sonic 3")
-                print(f"   - ElevenLabs: {elev_stats['mean']:.3f}s average TTFB")
-                print(f"   - Cartesia:   {cart_stats['mean']:.3f}s average TTFB")
+                out.append(f"1. ⚡ ElevenLabs Flash v2.5 TTFB is {(speedup-1)*100:.1f}% FASTER than Cartesia Sonic 3")
+                out.append(f"   - ElevenLabs: {elev_stats['mean']:.3f}s average TTFB")
+                out.append(f"   - Cartesia:   {cart_stats['mean']:.3f}s average TTFB")
             elif speedup < 0.9:
-                print(f"1. ⚡ Cartesia Sonic 3 TTFB is {(1/speedup-1)*100:.1f}% FASTER than ElevenLabs Flash v2.5")
-                print(f"   - Cartesia:   {cart_stats['mean']:.3f}s average TTFB")
-                print(f"   - ElevenLabs: {elev_stats['mean']:.3f}s average TTFB")
+                out.append(f"1. ⚡ Cartesia Sonic 3 TTFB is {(1/speedup-1)*100:.1f}% FASTER than ElevenLabs Flash v2.5")
+                out.append(f"   - Cartesia:   {cart_stats['mean']:.3f}s average TTFB")
+                out.append(f"   - ElevenLabs: {elev_stats['mean']:.3f}s average TTFB")
             else:
-                print(f"1. ⚖️  Both providers have similar TTFB")
-                print(f"   - Cartesia:   {cart_stats['mean']:.3f}s average TTFB")
-                print(f"   - ElevenLabs: {elev_stats['mean']:.3f}s average TTFB")
+                out.append(f"1. ⚖️  Both providers have similar TTFB")
+                out.append(f"   - Cartesia:   {cart_stats['mean']:.3f}s average TTFB")
+                out.append(f"   - ElevenLabs: {elev_stats['mean']:.3f}s average TTFB")
 
-            print()
+            out.append("")
 
             # Consistency
-            cart_cv = cart_stats['stdev'] / cart_stats['mean']
-            elev_cv = elev_stats['stdev'] / elev_stats['mean']
+            cart_cv = self._comparison.get("cart_cv",
+                                           cart_stats['stdev'] / cart_stats['mean'])
+            elev_cv = self._comparison.get("elev_cv",
+                                           elev_stats['stdev'] / elev_stats['mean'])
             if cart_cv < elev_cv * 0.9:
-                print(f"2. 📊 Cartesia TTFB is MORE CONSISTENT (CV: {cart_cv:.3f} vs {elev_cv:.3f})")
+                out.append(f"2. 📊 Cartesia TTFB is MORE CONSISTENT (CV: {cart_cv:.3f} vs {elev_cv:.3f})")
             elif elev_cv < cart_cv * 0.9:
-                print(f"2. 📊 ElevenLabs TTFB is MORE CONSISTENT (CV: {elev_cv:.3f} vs {cart_cv:.3f})")
+                out.append(f"2. 📊 ElevenLabs TTFB is MORE CONSISTENT (CV: {elev_cv:.3f} vs {cart_cv:.3f})")
             else:
-                print(f"2. 📊 Both providers have similar TTFB consistency")
+                out.append(f"2. 📊 Both providers have similar TTFB consistency")
 
-            print()
+            out.append("")
 
             # Language differences
-            print("3. 🌍 Language-specific TTFB performance:")
+            out.append("3. 🌍 Language-specific TTFB performance:")
             for lang in ["en", "de", "zh", "ja"]:
-                if lang in self.latency_by_language:
-                    cart_lang = self.latency_by_language[lang]["cartesia"]
-                    elev_lang = self.latency_by_language[lang]["elevenlabs"]
-                    if cart_lang and elev_lang:
-                        lang_speedup = statistics.mean(cart_lang) / statistics.mean(elev_lang)
-                        faster = "ElevenLabs" if lang_speedup > 1 else "Cartesia"
-                        print(f"   - {lang.upper()}: {faster} TTFB is faster ({lang_speedup:.2f}x)")
+                lang_stats = self._lang_stats.get(lang, {})
+                cart_lang = lang_stats.get("cartesia")
+                elev_lang = lang_stats.get("elevenlabs")
+                if cart_lang and elev_lang:
+                    lang_speedup = cart_lang['mean'] / elev_lang['mean']
+                    faster = "ElevenLabs" if lang_speedup > 1 else "Cartesia"
+                    out.append(f"   - {lang.upper()}: {faster} TTFB is faster ({lang_speedup:.2f}x)")
+
+        print("\n".join(out))
 
     def run_analysis(self):
         """Run complete TTFB analysis"""
@@ -368,8 +598,7 @@ class LatencyAnalyzer:
         print("="*70)
         print("(Time-to-First-Byte: how quickly audio streaming can begin)")
 
-        self.load_data()
-        self.extract_latency_data()
+        self.load_and_extract()
         self.compare_latency()
         self.analyze_by_language()
         self.correlate_latency_quality()
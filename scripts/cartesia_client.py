@@ -5,34 +5,79 @@ Generates audio using Cartesia Sonic 3 model
 
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from _ratelimit import TokenBucket
 
 
 class CartesiaClient:
     """Client for Cartesia TTS API (Sonic 3)"""
 
-    def __init__(self, api_key: str, output_dir: str = "outputs/cartesia"):
+    def __init__(self, api_key: str, output_dir: str = "outputs/cartesia", max_workers: int = 8,
+                 requests_per_minute: Optional[int] = None):
         """
         Initialize Cartesia client
 
         Args:
             api_key: Cartesia API key
             output_dir: Directory to save generated audio files
+            max_workers: Max concurrent requests for batch generation
+            requests_per_minute: Self-imposed rate cap shared across worker
+                                 threads; None disables client-side limiting
         """
         self.api_key = api_key
+        self.max_workers = max_workers
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.base_url = "https://api.cartesia.ai"
 
+        # Pooled keep-alive session: the TCP+TLS handshake is paid once and
+        # amortized across the whole batch instead of per request.
+        # Transient server errors and rate limits retry with backoff at
+        # the transport layer instead of surfacing as failed generations.
+        # allowed_methods=None opts POST in (urllib3 excludes it by
+        # default); regenerating a clip is effectively idempotent
+        self.session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=None)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry))
+        self.session.headers.update({
+            "X-API-Key": self.api_key,
+            "Cartesia-Version": "2025-04-16",  # Updated to latest API version
+            "Content-Type": "application/json"
+        })
+
+        if requests_per_minute:
+            self._bucket = TokenBucket(rate=requests_per_minute / 60,
+                                       capacity=max(1, requests_per_minute / 10))
+        else:
+            self._bucket = None
+
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def generate_speech(
         self,
         text: str,
         voice_id: str,
         model_id: str = "sonic-3",  # Updated to sonic-3
         output_format: str = "mp3",
-        language: str = "en"
+        language: str = "en",
+        output_path: Optional[Path] = None
     ) -> Dict:
         """
         Generate speech from text using Cartesia API
@@ -43,16 +88,12 @@ class CartesiaClient:
             model_id: Model ID (default: "sonic-3")
             output_format: Output format (mp3, wav, etc.)
             language: Language code
+            output_path: If given, stream audio straight to this file
+                         instead of buffering it in memory
 
         Returns:
-            Dict with status, file_path, and metadata
+            Dict with status, file_path or audio_data, and metadata
         """
-        headers = {
-            "X-API-Key": self.api_key,
-            "Cartesia-Version": "2025-04-16",  # Updated to latest API version
-            "Content-Type": "application/json"
-        }
-
         payload = {
             "model_id": model_id,
             "transcript": text,
@@ -73,13 +114,17 @@ class CartesiaClient:
             }
         }
 
+        # Wait for a rate-limit token before the clock starts, so the
+        # self-imposed pacing never shows up in TTFB
+        if self._bucket is not None:
+            self._bucket.acquire()
+
         start_time = time.time()
 
         try:
             # Use streaming to measure TTFB accurately
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/tts/bytes",
-                headers=headers,
                 json=payload,
                 timeout=30,
                 stream=True
@@ -87,20 +132,39 @@ class CartesiaClient:
 
             response.raise_for_status()
 
-            # Read first chunk to get accurate TTFB
-            chunks = []
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunks == []:
-                    # First chunk received - this is TTFB
-                    ttfb = time.time() - start_time
-                chunks.append(chunk)
+            # Read first chunk to get accurate TTFB. With an output_path the
+            # chunks go straight to disk and the audio is never held in
+            # memory; otherwise stream into one growing bytearray - no chunk
+            # list to hold and no final join copy, so peak memory is roughly
+            # the audio size instead of double it
+            ttfb = None
+            if output_path is not None:
+                # Stream to a sibling temp file and rename into place only
+                # once the body is complete - a connection dropped mid-body
+                # must not leave a truncated clip that skip-existing logic
+                # would treat as valid on later runs
+                tmp_path = output_path.with_suffix(".tmp")
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        if ttfb is None:
+                            # First chunk received - this is TTFB
+                            ttfb = time.time() - start_time
+                        f.write(chunk)
+                os.replace(tmp_path, output_path)
+                audio_data = None
+            else:
+                buf = bytearray()
+                for chunk in response.iter_content(chunk_size=65536):
+                    if ttfb is None:
+                        # First chunk received - this is TTFB
+                        ttfb = time.time() - start_time
+                    buf.extend(chunk)
+                audio_data = bytes(buf)
 
-            audio_data = b''.join(chunks)
             total_time = time.time() - start_time
 
-            return {
+            result = {
                 "status": "success",
-                "audio_data": audio_data,
                 "ttfb": ttfb,
                 "total_time": total_time,
                 "generation_time": ttfb,  # Keep for backwards compatibility
@@ -108,8 +172,19 @@ class CartesiaClient:
                 "model_id": model_id,
                 "voice_id": voice_id
             }
+            if output_path is not None:
+                result["file_path"] = str(output_path)
+            else:
+                result["audio_data"] = audio_data
+            return result
 
         except requests.exceptions.RequestException as e:
+            if output_path is not None:
+                # Drop any partial temp file so nothing half-written survives
+                try:
+                    os.remove(output_path.with_suffix(".tmp"))
+                except OSError:
+                    pass
             return {
                 "status": "error",
                 "error": str(e),
@@ -153,28 +228,40 @@ class CartesiaClient:
         Returns:
             Dict with result information
         """
-        result = self.generate_speech(
+        # Stream straight to the output file - the audio bytes never pass
+        # through a Python buffer on this path
+        return self.generate_speech(
             text=text,
             voice_id=voice_id,
             model_id=model_id,
-            language=language
+            language=language,
+            output_path=self.output_dir / f"cartesia_{test_id}.mp3"
         )
 
-        if result["status"] == "success":
-            filename = f"cartesia_{test_id}.mp3"
-            file_path = self.save_audio(result["audio_data"], filename)
-            result["file_path"] = file_path
-            del result["audio_data"]  # Remove binary data from result
+    def generate_and_save_many(self, cases: List[Dict]) -> List[Dict]:
+        """
+        Generate speech for multiple test cases concurrently
 
-        return result
+        The workload is network-bound, so requests fan out over a thread
+        pool sharing the keep-alive session; results keep input order.
+
+        Args:
+            cases: List of dicts with generate_and_save keyword arguments
+                   (test_id, text, voice_id, language, model_id)
+
+        Returns:
+            List of result dicts, one per case, in input order
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [pool.submit(self.generate_and_save, **case) for case in cases]
+            return [f.result() for f in futures]
 
 
 if __name__ == "__main__":
     # Test the client
-    import yaml
+    from _config import load_config
 
-    with open("config.yaml") as f:
-        config = yaml.safe_load(f)
+    config = load_config()
 
     api_key = config["api_keys"]["cartesia"]
     if api_key == "YOUR_CARTESIA_API_KEY":
@@ -5,77 +5,95 @@ Checks if everything is configured correctly before running evaluations
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import yaml
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+_env_loaded = False
+
+# Values that mean "no key configured" - one hashed lookup covers them all
+_PLACEHOLDER_KEYS = frozenset({
+    "", "YOUR_CARTESIA_API_KEY", "CARTESIA_API_KEY",
+    "YOUR_ELEVENLABS_API_KEY", "ELEVENLABS_API_KEY",
+})
+
+
+def _is_placeholder(key):
+    """True when the key is missing or still a template placeholder"""
+    return (not key) or key in _PLACEHOLDER_KEYS
+
+
+def _ensure_env_loaded():
+    """Load .env lazily - only the API-key check needs it"""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
 
 
 def check_config_file():
     """Check if config.yaml exists and is valid"""
-    print("\n1. Checking config.yaml...")
+    out = ["\n1. Checking config.yaml..."]
 
     config_file = Path("config.yaml")
     if not config_file.exists():
-        print("   ❌ config.yaml not found")
-        return False
+        out.append("   ❌ config.yaml not found")
+        return False, out
 
+    from _config import load_config
     try:
-        with open(config_file) as f:
-            config = yaml.safe_load(f)
-        print("   ✅ config.yaml found and valid")
-        return config
+        config = load_config(str(config_file))
+        out.append("   ✅ config.yaml found and valid")
+        return config, out
     except Exception as e:
-        print(f"   ❌ Error reading config.yaml: {e}")
-        return False
+        out.append(f"   ❌ Error reading config.yaml: {e}")
+        return False, out
 
 
 def check_api_keys(config):
     """Check if API keys are configured"""
-    print("\n2. Checking API keys...")
+    _ensure_env_loaded()
+    out = ["\n2. Checking API keys..."]
 
     issues = []
 
     # Check for .env file
     env_file = Path(".env")
     if env_file.exists():
-        print("   ✅ .env file found")
+        out.append("   ✅ .env file found")
     else:
-        print("   ⚠️  No .env file (you can create one from .env.example)")
+        out.append("   ⚠️  No .env file (you can create one from .env.example)")
 
     # Check Cartesia key (from env or config)
     cartesia_key = os.getenv("CARTESIA_API_KEY", config.get("api_keys", {}).get("cartesia", ""))
     cartesia_source = "env" if os.getenv("CARTESIA_API_KEY") else "config"
 
-    if not cartesia_key or cartesia_key == "YOUR_CARTESIA_API_KEY" or cartesia_key == "CARTESIA_API_KEY":
+    if _is_placeholder(cartesia_key):
         issues.append("   ❌ Cartesia API key not configured")
     else:
-        print(f"   ✅ Cartesia API key configured ({cartesia_key[:10]}... from {cartesia_source})")
+        out.append(f"   ✅ Cartesia API key configured ({cartesia_key[:10]}... from {cartesia_source})")
 
     # Check Eleven Labs key (from env or config)
     elevenlabs_key = os.getenv("ELEVENLABS_API_KEY", config.get("api_keys", {}).get("elevenlabs", ""))
     elevenlabs_source = "env" if os.getenv("ELEVENLABS_API_KEY") else "config"
 
-    if not elevenlabs_key or elevenlabs_key == "YOUR_ELEVENLABS_API_KEY" or elevenlabs_key == "ELEVENLABS_API_KEY":
+    if _is_placeholder(elevenlabs_key):
         issues.append("   ❌ Eleven Labs API key not configured")
     else:
-        print(f"   ✅ Eleven Labs API key configured ({elevenlabs_key[:10]}... from {elevenlabs_source})")
+        out.append(f"   ✅ Eleven Labs API key configured ({elevenlabs_key[:10]}... from {elevenlabs_source})")
 
     if issues:
-        for issue in issues:
-            print(issue)
-        print("\n   💡 Option 1: Create .env file and add keys there")
-        print("   💡 Option 2: Edit config.yaml and add your API keys")
-        return False
+        out.extend(issues)
+        out.append("\n   💡 Option 1: Create .env file and add keys there")
+        out.append("   💡 Option 2: Edit config.yaml and add your API keys")
+        return False, out
 
-    return True
+    return True, out
 
 
 def check_voice_ids(config):
     """Check if voice IDs are configured"""
-    print("\n3. Checking voice IDs...")
+    out = ["\n3. Checking voice IDs..."]
 
     issues = []
 
@@ -84,68 +102,90 @@ def check_voice_ids(config):
     if not cartesia_voice:
         issues.append("   ⚠️  Cartesia English voice ID not configured")
     else:
-        print(f"   ✅ Cartesia English voice configured ({cartesia_voice[:20]}...)")
+        out.append(f"   ✅ Cartesia English voice configured ({cartesia_voice[:20]}...)")
 
     # Check Eleven Labs voice
     elevenlabs_voice = config.get("models", {}).get("elevenlabs", {}).get("language_voices", {}).get("en")
     if not elevenlabs_voice:
         issues.append("   ⚠️  Eleven Labs English voice ID not configured")
     else:
-        print(f"   ✅ Eleven Labs English voice configured ({elevenlabs_voice[:20]}...)")
+        out.append(f"   ✅ Eleven Labs English voice configured ({elevenlabs_voice[:20]}...)")
 
     if issues:
-        for issue in issues:
-            print(issue)
-        print("\n   💡 See SETUP_GUIDE.md for instructions on finding voice IDs")
-        return False
+        out.extend(issues)
+        out.append("\n   💡 See SETUP_GUIDE.md for instructions on finding voice IDs")
+        return False, out
 
-    return True
+    return True, out
 
 
 def check_test_cases():
     """Check if test cases exist"""
-    print("\n4. Checking test cases...")
+    out = ["\n4. Checking test cases..."]
 
-    test_file = Path("test_cases/english.json")
-    if not test_file.exists():
-        print("   ❌ test_cases/english.json not found")
-        return False
+    files = sorted(Path("test_cases").glob("*.json"))
+    if not files:
+        out.append("   ❌ no test case files found in test_cases/")
+        return False, out
+
+    try:
+        import orjson as _json
+    except ImportError:  # optional fast JSON parser, stdlib json works too
+        import json as _json
+
+    def _count(path):
+        data = _json.loads(path.read_bytes())
+        return path.stem, sum(len(cat["tests"]) for cat in data.get("test_categories", []))
 
-    import json
     try:
-        with open(test_file) as f:
-            data = json.load(f)
+        # Each file is an independent read+parse - overlap them
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+            counts = list(pool.map(_count, files))
 
-        total_tests = sum(len(cat["tests"]) for cat in data.get("test_categories", []))
-        print(f"   ✅ Found {total_tests} English test cases")
-        return True
+        total = 0
+        for language, count in counts:
+            out.append(f"   ✅ Found {count} {language.title()} test cases")
+            total += count
+        out.append(f"   ✅ {total} test cases across {len(counts)} languages")
+        return True, out
 
     except Exception as e:
-        print(f"   ❌ Error reading test cases: {e}")
-        return False
+        out.append(f"   ❌ Error reading test cases: {e}")
+        return False, out
 
 
 def check_directories():
     """Check if required directories exist"""
-    print("\n5. Checking directories...")
+    out = ["\n5. Checking directories..."]
 
     dirs = ["outputs/cartesia", "outputs/elevenlabs", "results", "scripts"]
     all_exist = True
 
+    # One scandir per parent instead of one stat per expected directory -
+    # the entry type comes back cached from the directory listing itself
+    found = {}
+    for parent in {str(Path(d).parent) for d in dirs}:
+        try:
+            with os.scandir(parent) as entries:
+                found[parent] = {e.name for e in entries
+                                 if e.is_dir(follow_symlinks=False)}
+        except FileNotFoundError:
+            found[parent] = set()
+
     for dir_path in dirs:
         path = Path(dir_path)
-        if path.exists():
-            print(f"   ✅ {dir_path}/")
+        if path.name in found[str(path.parent)]:
+            out.append(f"   ✅ {dir_path}/")
         else:
-            print(f"   ❌ {dir_path}/ not found")
+            out.append(f"   ❌ {dir_path}/ not found")
             all_exist = False
 
-    return all_exist
+    return all_exist, out
 
 
 def check_dependencies():
     """Check if required Python packages are installed"""
-    print("\n6. Checking Python dependencies...")
+    out = ["\n6. Checking Python dependencies..."]
 
     required = {
         "yaml": "pyyaml",
@@ -154,66 +194,153 @@ def check_dependencies():
         "tqdm": "tqdm"
     }
 
+    # find_spec only probes the import machinery for the module's
+    # existence - no point actually importing gradio and its hundreds of
+    # transitive modules just to confirm it is installed
+    import importlib.util
+
     missing = []
     for module, package in required.items():
-        try:
-            __import__(module)
-            print(f"   ✅ {package}")
-        except ImportError:
-            print(f"   ❌ {package} not installed")
+        if importlib.util.find_spec(module) is not None:
+            out.append(f"   ✅ {package}")
+        else:
+            out.append(f"   ❌ {package} not installed")
             missing.append(package)
 
     if missing:
-        print(f"\n   💡 Install missing packages: pip install {' '.join(missing)}")
-        return False
+        out.append(f"\n   💡 Install missing packages: pip install {' '.join(missing)}")
+        return False, out
+
+    return True, out
 
-    return True
+
+def _count_mp3s(dir_path):
+    """Count .mp3 files via one scandir pass - no fnmatch, no Path objects"""
+    try:
+        with os.scandir(dir_path) as entries:
+            return sum(1 for e in entries
+                       if e.name.endswith(".mp3") and e.is_file(follow_symlinks=False))
+    except FileNotFoundError:
+        return 0
 
 
 def check_audio_files():
     """Check if any audio files have been generated"""
-    print("\n7. Checking for generated audio...")
+    out = ["\n7. Checking for generated audio..."]
 
-    cartesia_files = list(Path("outputs/cartesia").glob("*.mp3"))
-    elevenlabs_files = list(Path("outputs/elevenlabs").glob("*.mp3"))
+    cartesia_files = _count_mp3s("outputs/cartesia")
+    elevenlabs_files = _count_mp3s("outputs/elevenlabs")
 
     if cartesia_files:
-        print(f"   ✅ Found {len(cartesia_files)} Cartesia audio files")
+        out.append(f"   ✅ Found {cartesia_files} Cartesia audio files")
     else:
-        print("   ⚠️  No Cartesia audio files found")
+        out.append("   ⚠️  No Cartesia audio files found")
 
     if elevenlabs_files:
-        print(f"   ✅ Found {len(elevenlabs_files)} Eleven Labs audio files")
+        out.append(f"   ✅ Found {elevenlabs_files} Eleven Labs audio files")
     else:
-        print("   ⚠️  No Eleven Labs audio files found")
+        out.append("   ⚠️  No Eleven Labs audio files found")
 
     if not cartesia_files and not elevenlabs_files:
-        print("\n   💡 Run: python scripts/generate_audio.py --filter E1-H1")
-        print("      This will test audio generation with a single test case")
+        out.append("\n   💡 Run: python scripts/generate_audio.py --filter E1-H1")
+        out.append("      This will test audio generation with a single test case")
+
+    return True, out  # Not critical for initial setup
+
+
+_SENTINEL_FILE = Path(".tts-eval-cache/setup.json")
+_SENTINEL_MAX_AGE = 86400  # a cached pass is trusted for one day
+
+
+def _setup_fingerprint():
+    """Fingerprint of everything the checks look at
+
+    Hashes config.yaml bytes, the test-case file mtimes, and which (not
+    what) API-key env vars are set - any change invalidates the sentinel.
+    """
+    import hashlib
+
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        h.update(Path("config.yaml").read_bytes())
+    except OSError:
+        pass
+    for path in sorted(Path("test_cases").glob("*.json")):
+        h.update(f"{path.name}:{path.stat().st_mtime_ns}".encode())
+    for var in ("CARTESIA_API_KEY", "ELEVENLABS_API_KEY"):
+        if os.environ.get(var):
+            h.update(var.encode())
+    return h.hexdigest()
+
+
+def _read_sentinel():
+    import json
+    try:
+        return json.loads(_SENTINEL_FILE.read_bytes())
+    except (OSError, ValueError):
+        return None
+
 
-    return True  # Not critical for initial setup
+def _write_sentinel(fingerprint):
+    import json
+    import time
+    try:
+        _SENTINEL_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _SENTINEL_FILE.write_text(json.dumps(
+            {"fingerprint": fingerprint, "ts": time.time()}))
+    except OSError:
+        pass  # sentinel is best-effort
 
 
 def main():
     """Run all checks"""
+    import time
+
+    force = "--force" in sys.argv[1:]
+    _ensure_env_loaded()  # the fingerprint covers env-provided keys
+    fingerprint = _setup_fingerprint()
+
+    # Skip the whole run when nothing checked has changed since the last
+    # successful pass within the past day
+    if not force:
+        sentinel = _read_sentinel()
+        if (sentinel
+                and sentinel.get("fingerprint") == fingerprint
+                and time.time() - sentinel.get("ts", 0) < _SENTINEL_MAX_AGE):
+            print("✅ Setup check passed earlier and nothing has changed "
+                  "(use --force to re-run)")
+            return 0
+
     print("="*60)
     print("TTS Evaluation Framework - Setup Check")
     print("="*60)
 
     checks = []
 
-    # Run checks
-    config = check_config_file()
+    # Config first - the key and voice checks depend on it
+    config, config_log = check_config_file()
+    print("\n".join(config_log))
     checks.append(("config", bool(config)))
 
+    # The remaining checks are independent and mostly wait on the
+    # filesystem or imports, so they run concurrently; results print in
+    # the original fixed order once everything is gathered
+    jobs = []
     if config:
-        checks.append(("api_keys", check_api_keys(config)))
-        checks.append(("voice_ids", check_voice_ids(config)))
-
-    checks.append(("test_cases", check_test_cases()))
-    checks.append(("directories", check_directories()))
-    checks.append(("dependencies", check_dependencies()))
-    check_audio_files()  # Informational only
+        jobs.append(("api_keys", lambda: check_api_keys(config)))
+        jobs.append(("voice_ids", lambda: check_voice_ids(config)))
+    jobs.append(("test_cases", check_test_cases))
+    jobs.append(("directories", check_directories))
+    jobs.append(("dependencies", check_dependencies))
+    jobs.append((None, check_audio_files))  # Informational only
+
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = [(name, pool.submit(fn)) for name, fn in jobs]
+        for name, future in futures:
+            status, log = future.result()
+            print("\n".join(log))
+            if name is not None:
+                checks.append((name, status))
 
     # Summary
     print("\n" + "="*60)
@@ -234,10 +361,12 @@ def main():
         print("\nNext steps:")
         print("1. Generate test audio: python scripts/generate_audio.py --filter E1-H1")
         print("2. Launch evaluation: python scripts/evaluate.py --language en")
+        _write_sentinel(fingerprint)
         return 0
     else:
         print(f"\n⚠️  {total - passed} check(s) failed. Please fix the issues above.")
         print("\nSee SETUP_GUIDE.md for detailed setup instructions.")
+        _SENTINEL_FILE.unlink(missing_ok=True)  # failures never cache
         return 1
 
 
@@ -3,36 +3,113 @@ Eleven Labs TTS API Client
 Generates audio using Eleven Labs Flash v2.5 model
 """
 
+import json
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from _ratelimit import TokenBucket
 
 
 class ElevenLabsClient:
     """Client for Eleven Labs TTS API (Flash v2.5)"""
 
-    def __init__(self, api_key: str, output_dir: str = "outputs/elevenlabs"):
+    def __init__(self, api_key: Optional[str] = None, output_dir: str = "outputs/elevenlabs",
+                 requests_per_minute: Optional[int] = None):
         """
         Initialize Eleven Labs client
 
         Args:
-            api_key: Eleven Labs API key
+            api_key: Eleven Labs API key; falls back to the
+                     ELEVENLABS_API_KEY env var on first API call
             output_dir: Directory to save generated audio files
+            requests_per_minute: Self-imposed rate cap shared across worker
+                                 threads; None disables client-side limiting
         """
-        self.api_key = api_key
+        self._api_key = api_key
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._output_dir_ready = False
         self.base_url = "https://api.elevenlabs.io/v1"
 
+        # Pooled keep-alive session: the TCP+TLS handshake is paid once and
+        # amortized across the whole batch instead of per request. Transient
+        # server errors and rate limits retry with backoff at the transport
+        # layer instead of surfacing as failed generations. allowed_methods=
+        # None opts POST in (urllib3 excludes it by default); regenerating a
+        # clip is effectively idempotent
+        self.session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=None)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=1, pool_maxsize=8, max_retries=retry))
+        self.session.headers["Content-Type"] = "application/json"
+        if api_key is not None:
+            self.session.headers["xi-api-key"] = api_key
+
+        if requests_per_minute:
+            self._bucket = TokenBucket(rate=requests_per_minute / 60,
+                                       capacity=max(1, requests_per_minute / 10))
+        else:
+            self._bucket = None
+
+        # Voice settings never vary per call - build the dict once and share
+        # the reference in every payload (requests only serializes it)
+        self._voice_settings = {
+            "stability": 0.5,
+            "similarity_boost": 0.75,
+            "style": 0.0,
+            "use_speaker_boost": True
+        }
+
+    @property
+    def api_key(self) -> str:
+        """API key, resolved lazily from the environment on first use
+
+        Constructing the client never requires credentials, so imports and
+        tooling that stay off the API work without any key configured.
+        """
+        if self._api_key is None:
+            self._api_key = os.environ.get("ELEVENLABS_API_KEY")
+            if not self._api_key:
+                raise RuntimeError(
+                    "Set the ELEVENLABS_API_KEY environment variable "
+                    "or pass api_key= to ElevenLabsClient")
+            self.session.headers["xi-api-key"] = self._api_key
+        return self._api_key
+
+    def _ensure_output_dir(self):
+        """Create the output directory on first write, not at construction
+
+        Clients built for list_voices or inspection never touch the disk.
+        """
+        if not self._output_dir_ready:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._output_dir_ready = True
+
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def generate_speech(
         self,
         text: str,
         voice_id: str,
         model_id: str = "eleven_flash_v2_5",
         output_format: str = "mp3_44100_128",
-        language_code: Optional[str] = None
+        language_code: Optional[str] = None,
+        output_path: Optional[Path] = None
     ) -> Dict:
         """
         Generate speech from text using Eleven Labs API
@@ -43,24 +120,16 @@ class ElevenLabsClient:
             model_id: Model ID (default: "eleven_flash_v2_5")
             output_format: Output format
             language_code: Optional ISO 639-1 language code (e.g., 'ja' for Japanese)
+            output_path: If given, stream audio straight to this file
+                         instead of buffering it in memory
 
         Returns:
-            Dict with status, file_path, and metadata
+            Dict with status, file_path or audio_data, and metadata
         """
-        headers = {
-            "xi-api-key": self.api_key,
-            "Content-Type": "application/json"
-        }
-
         payload = {
             "text": text,
             "model_id": model_id,
-            "voice_settings": {
-                "stability": 0.5,
-                "similarity_boost": 0.75,
-                "style": 0.0,
-                "use_speaker_boost": True
-            }
+            "voice_settings": self._voice_settings
         }
 
         # Add language-specific parameters
@@ -70,13 +139,20 @@ class ElevenLabsClient:
             if language_code == "ja":
                 payload["apply_text_normalization"] = "on"
 
+        # Resolve credentials (may raise) before the timed request starts
+        _ = self.api_key
+
+        # Wait for a rate-limit token before the clock starts, so the
+        # self-imposed pacing never shows up in TTFB
+        if self._bucket is not None:
+            self._bucket.acquire()
+
         start_time = time.time()
 
         try:
             # Use streaming to measure TTFB accurately
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/text-to-speech/{voice_id}",
-                headers=headers,
                 json=payload,
                 params={"output_format": output_format},
                 timeout=30,
@@ -85,20 +161,38 @@ class ElevenLabsClient:
 
             response.raise_for_status()
 
-            # Read first chunk to get accurate TTFB
-            chunks = []
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunks == []:
-                    # First chunk received - this is TTFB
-                    ttfb = time.time() - start_time
-                chunks.append(chunk)
+            # Read first chunk to get accurate TTFB. With an output_path the
+            # chunks go straight to disk and the audio is never held in
+            # memory; otherwise stream into one growing bytearray - no chunk
+            # list to hold and no final join copy
+            ttfb = None
+            if output_path is not None:
+                # Stream to a sibling temp file and rename into place only
+                # once the body is complete - a connection dropped mid-body
+                # must not leave a truncated clip that the skip-existing
+                # size check would accept on later runs
+                tmp_path = output_path.with_suffix(".tmp")
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        if ttfb is None:
+                            # First chunk received - this is TTFB
+                            ttfb = time.time() - start_time
+                        f.write(chunk)
+                os.replace(tmp_path, output_path)
+                audio_data = None
+            else:
+                buf = bytearray()
+                for chunk in response.iter_content(chunk_size=65536):
+                    if ttfb is None:
+                        # First chunk received - this is TTFB
+                        ttfb = time.time() - start_time
+                    buf.extend(chunk)
+                audio_data = bytes(buf)
 
-            audio_data = b''.join(chunks)
             total_time = time.time() - start_time
 
-            return {
+            result = {
                 "status": "success",
-                "audio_data": audio_data,
                 "ttfb": ttfb,
                 "total_time": total_time,
                 "generation_time": ttfb,  # Keep for backwards compatibility
@@ -106,8 +200,19 @@ class ElevenLabsClient:
                 "model_id": model_id,
                 "voice_id": voice_id
             }
+            if output_path is not None:
+                result["file_path"] = str(output_path)
+            else:
+                result["audio_data"] = audio_data
+            return result
 
         except requests.exceptions.RequestException as e:
+            if output_path is not None:
+                # Drop any partial temp file so nothing half-written survives
+                try:
+                    os.remove(output_path.with_suffix(".tmp"))
+                except OSError:
+                    pass
             return {
                 "status": "error",
                 "error": str(e),
@@ -125,18 +230,28 @@ class ElevenLabsClient:
         Returns:
             Full path to saved file
         """
+        self._ensure_output_dir()
         file_path = self.output_dir / filename
         with open(file_path, 'wb') as f:
             f.write(audio_data)
         return str(file_path)
 
+    def _existing_outputs(self) -> set:
+        """Names of non-empty files already in the output directory"""
+        try:
+            return {e.name for e in os.scandir(self.output_dir)
+                    if e.is_file(follow_symlinks=False) and e.stat().st_size > 0}
+        except FileNotFoundError:
+            return set()
+
     def generate_and_save(
         self,
         test_id: str,
         text: str,
         voice_id: str,
         model_id: str = "eleven_flash_v2_5",
-        language_code: Optional[str] = None
+        language_code: Optional[str] = None,
+        overwrite: bool = False
     ) -> Dict:
         """
         Generate speech and save to file
@@ -147,43 +262,115 @@ class ElevenLabsClient:
             voice_id: Voice ID
             model_id: Model ID
             language_code: Optional ISO 639-1 language code
+            overwrite: Regenerate even if the output file already exists
 
         Returns:
             Dict with result information
         """
-        result = self.generate_speech(
+        output_path = self.output_dir / f"elevenlabs_{test_id}.mp3"
+
+        # Resuming a batch should not re-pay the API round trip for clips
+        # that already exist from a previous run
+        if not overwrite:
+            try:
+                if output_path.stat().st_size > 0:
+                    return {
+                        "status": "skipped",
+                        "file_path": str(output_path),
+                        "model_id": model_id,
+                        "voice_id": voice_id
+                    }
+            except OSError:
+                pass
+
+        # Stream straight to the output file - the audio bytes never pass
+        # through a Python buffer on this path
+        self._ensure_output_dir()
+        return self.generate_speech(
             text=text,
             voice_id=voice_id,
             model_id=model_id,
-            language_code=language_code
+            language_code=language_code,
+            output_path=output_path
         )
 
-        if result["status"] == "success":
-            filename = f"elevenlabs_{test_id}.mp3"
-            file_path = self.save_audio(result["audio_data"], filename)
-            result["file_path"] = file_path
-            del result["audio_data"]  # Remove binary data from result
+    def generate_and_save_many(self, items: List[Dict], max_workers: int = 8,
+                               overwrite: bool = False) -> List[Dict]:
+        """
+        Generate speech for multiple test cases concurrently
+
+        The workload is network-bound, so requests fan out over a thread
+        pool sharing the keep-alive session; results keep input order.
+        Items whose output file already exists are skipped unless
+        overwrite is set - the existing names are collected in one
+        directory scan before the fan-out.
 
-        return result
+        Args:
+            items: List of dicts with generate_and_save keyword arguments
+                   (test_id, text, voice_id, model_id, language_code)
+            max_workers: Max concurrent requests (keep within the session's
+                         connection pool and ElevenLabs rate limits)
+            overwrite: Regenerate outputs that already exist
+
+        Returns:
+            List of result dicts, one per item, in input order
+        """
+        existing = set() if overwrite else self._existing_outputs()
+
+        results = [None] * len(items)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = []
+            for i, item in enumerate(items):
+                filename = f"elevenlabs_{item['test_id']}.mp3"
+                if filename in existing:
+                    results[i] = {
+                        "status": "skipped",
+                        "file_path": str(self.output_dir / filename),
+                        "model_id": item.get("model_id", "eleven_flash_v2_5"),
+                        "voice_id": item.get("voice_id")
+                    }
+                else:
+                    futures.append((i, pool.submit(
+                        self.generate_and_save, overwrite=True, **item)))
+            for i, future in futures:
+                results[i] = future.result()
+        return results
 
     def list_voices(self) -> Dict:
         """
         List available voices
 
+        The voice catalog rarely changes, so the response is cached on disk
+        with its ETag; later calls send If-None-Match and a 304 answers
+        from the cache with no body transfer or JSON parse of a fresh copy.
+
         Returns:
             Dict with available voices
         """
-        headers = {
-            "xi-api-key": self.api_key
-        }
+        _ = self.api_key  # resolve credentials before the call
+
+        cache_file = self.output_dir / ".voices_cache.json"
+        etag_file = self.output_dir / ".voices_etag"
+
+        headers = {}
+        if cache_file.exists() and etag_file.exists():
+            headers["If-None-Match"] = etag_file.read_text()
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/voices",
                 headers=headers,
                 timeout=10
             )
+            if response.status_code == 304:
+                return json.loads(cache_file.read_bytes())
             response.raise_for_status()
+
+            etag = response.headers.get("ETag")
+            if etag:
+                self._ensure_output_dir()
+                cache_file.write_bytes(response.content)
+                etag_file.write_text(etag)
             return response.json()
 
         except requests.exceptions.RequestException as e:
@@ -195,10 +382,9 @@ class ElevenLabsClient:
 
 if __name__ == "__main__":
     # Test the client
-    import yaml
+    from _config import load_config
 
-    with open("config.yaml") as f:
-        config = yaml.safe_load(f)
+    config = load_config()
 
     api_key = config["api_keys"]["elevenlabs"]
     if api_key == "YOUR_ELEVENLABS_API_KEY":
@@ -3,8 +3,10 @@ Interactive Evaluation Interface
 Web-based tool for manual TTS evaluation and comparison
 """
 
+import bisect
+import hashlib
 import json
-import yaml
+import pickle
 import gradio as gr
 import os
 from pathlib import Path
@@ -12,22 +14,40 @@ from typing import Dict, List, Optional
 from datetime import datetime
 from dotenv import load_dotenv
 
+from _config import load_config
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON parser, stdlib json works too
+    orjson = None
+
 # Load environment variables from .env file
 load_dotenv()
 
 
+def _load_json_bytes(data: bytes):
+    """Parse JSON bytes with orjson when available"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
 class EvaluationInterface:
     """Interactive evaluation interface for TTS comparison"""
 
     def __init__(self, config_path: str = "config.yaml"):
         """Initialize the evaluation interface"""
-        with open(config_path) as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_config(config_path)
 
         self.test_cases = []
         self.current_index = 0
         self.evaluations = []
         self.evaluated_test_ids = set()  # Track which tests are done
+        self._eval_index = {}  # test_id -> index in self.evaluations
+        self._test_id_to_idx = {}  # test_id -> index in self.test_cases
+        self._choices_by_category = {}  # category -> [(test_id, category)]
+        self._categories = []  # sorted category names for the filter
+        self._unevaluated_indices = []  # sorted test indices still to do
+        self._display_cache = {}  # (test_id, evaluated) -> display outputs
+        self._saves_since_compact = 0
 
         # Create results directory
         Path("results").mkdir(exist_ok=True)
@@ -51,12 +71,29 @@ class EvaluationInterface:
         if not test_file.exists():
             return []
 
-        with open(test_file) as f:
-            data = json.load(f)
+        # Flattening also bakes in audio existence and latency, so the
+        # cache key covers the test file, the output dirs, and the logs
+        digest = self._startup_cache_digest(test_file)
+        cached = self._read_startup_cache(f"testcases_{language}", digest)
+        if cached is not None:
+            return cached
+
+        data = _load_json_bytes(test_file.read_bytes())
 
         # Load generation logs to get latency data
         latency_data = self._load_latency_data()
 
+        # One directory listing per provider replaces two stat syscalls
+        # per test case below
+        def _names(dir_path):
+            try:
+                return {e.name for e in os.scandir(dir_path)}
+            except FileNotFoundError:
+                return set()
+
+        cartesia_names = _names("outputs/cartesia")
+        elevenlabs_names = _names("outputs/elevenlabs")
+
         # Flatten test cases
         test_cases = []
         for category in data["test_categories"]:
@@ -68,9 +105,13 @@ class EvaluationInterface:
                 test["cartesia_audio"] = f"outputs/cartesia/cartesia_{test['test_id']}.mp3"
                 test["elevenlabs_audio"] = f"outputs/elevenlabs/elevenlabs_{test['test_id']}.mp3"
 
-                # Check if audio files exist
-                test["has_cartesia"] = Path(test["cartesia_audio"]).exists()
-                test["has_elevenlabs"] = Path(test["elevenlabs_audio"]).exists()
+                # Check if audio files exist (against the cached listings)
+                test["has_cartesia"] = f"cartesia_{test['test_id']}.mp3" in cartesia_names
+                test["has_elevenlabs"] = f"elevenlabs_{test['test_id']}.mp3" in elevenlabs_names
+
+                # Pre-resolve what the audio players get - path or None
+                test["cartesia_audio_or_none"] = test["cartesia_audio"] if test["has_cartesia"] else None
+                test["elevenlabs_audio_or_none"] = test["elevenlabs_audio"] if test["has_elevenlabs"] else None
 
                 # Add latency data
                 test["cartesia_latency"] = latency_data.get("cartesia", {}).get(test["test_id"], None)
@@ -79,50 +120,188 @@ class EvaluationInterface:
                 if test["has_cartesia"] or test["has_elevenlabs"]:
                     test_cases.append(test)
 
+        self._write_startup_cache(f"testcases_{language}", digest, test_cases)
         return test_cases
 
+    _CACHE_DIR = Path("results/.cache")
+
+    def _startup_cache_digest(self, test_file: Path) -> str:
+        """Fingerprint of everything the flattened test list depends on"""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(str(test_file.stat().st_mtime_ns).encode())
+        for dir_path in ("outputs/cartesia", "outputs/elevenlabs"):
+            try:
+                h.update(str(os.stat(dir_path).st_mtime_ns).encode())
+            except OSError:
+                h.update(b"missing")
+        try:
+            with os.scandir("results") as entries:
+                logs = sorted(
+                    (e.name, e.stat().st_mtime_ns) for e in entries
+                    if e.name.startswith("generation_log_") and e.name.endswith(".json"))
+        except FileNotFoundError:
+            logs = []
+        for name, mtime_ns in logs:
+            h.update(f"{name}:{mtime_ns}".encode())
+        return h.hexdigest()
+
+    def _read_startup_cache(self, prefix: str, digest: str):
+        try:
+            with open(self._CACHE_DIR / f"{prefix}_{digest}.pkl", "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def _write_startup_cache(self, prefix: str, digest: str, value):
+        """Atomically persist a startup artifact; drops stale siblings"""
+        try:
+            self._CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            for stale in self._CACHE_DIR.glob(f"{prefix}_*.pkl"):
+                stale.unlink(missing_ok=True)
+            tmp = self._CACHE_DIR / f"{prefix}_{digest}.pkl.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._CACHE_DIR / f"{prefix}_{digest}.pkl")
+        except OSError:
+            pass  # cache is best-effort
+
     def _load_latency_data(self) -> Dict:
         """Load latency data from generation logs"""
         latency_data = {"cartesia": {}, "elevenlabs": {}}
 
-        # Find all generation logs
-        log_files = sorted(Path("results").glob("generation_log_*.json"))
-
-        for log_file in log_files:
-            try:
-                with open(log_file) as f:
-                    data = json.load(f)
-
-                # Extract latency for each provider
-                for provider in ["cartesia", "elevenlabs"]:
-                    for entry in data.get(provider, []):
-                        test_id = entry.get("test_id")
-                        gen_time = entry.get("generation_time")
-                        if test_id and gen_time:
-                            latency_data[provider][test_id] = gen_time
-            except:
-                continue
-
+        # Find all generation logs with one directory read - glob would
+        # stat every match on top of listing it. Name order matches
+        # timestamp order for these files
+        try:
+            with os.scandir("results") as entries:
+                log_entries = sorted(
+                    ((e.name, e.stat().st_mtime_ns) for e in entries
+                     if e.name.startswith("generation_log_") and e.name.endswith(".json")))
+        except FileNotFoundError:
+            log_entries = []
+        # Parsed results are cached per file keyed by mtime, so adding one
+        # new log re-parses that log alone - the rest merge from cache
+        try:
+            with open(self._CACHE_DIR / "latency_per_file.pkl", "rb") as f:
+                cached = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            cached = {}
+
+        fresh = {}
+        dirty = False
+        for name, mtime_ns in log_entries:
+            entry = cached.get(name)
+            if entry is not None and entry[0] == mtime_ns:
+                partial = entry[1]
+            else:
+                partial = {"cartesia": {}, "elevenlabs": {}}
+                try:
+                    data = _load_json_bytes((Path("results") / name).read_bytes())
+
+                    # Extract latency for each provider
+                    for provider in ["cartesia", "elevenlabs"]:
+                        for item in data.get(provider, []):
+                            test_id = item.get("test_id")
+                            gen_time = item.get("generation_time")
+                            if test_id and gen_time:
+                                partial[provider][test_id] = gen_time
+                except (OSError, ValueError, TypeError):
+                    pass  # unreadable or malformed log contributes nothing
+                dirty = True
+            fresh[name] = (mtime_ns, partial)
+            for provider in ["cartesia", "elevenlabs"]:
+                latency_data[provider].update(partial[provider])
+
+        if dirty or len(fresh) != len(cached):
+            self._write_per_file_cache(fresh)
         return latency_data
 
+    def _write_per_file_cache(self, value):
+        """Atomically persist the per-log parse cache"""
+        try:
+            self._CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = self._CACHE_DIR / "latency_per_file.pkl.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._CACHE_DIR / "latency_per_file.pkl")
+        except OSError:
+            pass  # cache is best-effort
+
     def _load_existing_evaluations(self):
-        """Load existing evaluations from file"""
+        """Load existing evaluations from file
+
+        A pickle sidecar written alongside the JSON loads without any
+        parsing; it is trusted only while at least as new as the JSON, so
+        hand-edited or externally written files still win.
+        """
         eval_file = Path("results/evaluations.json")
 
         if eval_file.exists():
             try:
-                with open(eval_file) as f:
-                    self.evaluations = json.load(f)
+                self.evaluations = self._read_eval_sidecar(eval_file)
+                if self.evaluations is None:
+                    self.evaluations = _load_json_bytes(eval_file.read_bytes())
 
-                # Track which tests have been evaluated
-                self.evaluated_test_ids = {e["test_id"] for e in self.evaluations}
+                # Track which tests have been evaluated, and where each
+                # evaluation sits for O(1) lookups from the UI callbacks
+                self._eval_index = {e["test_id"]: i for i, e in enumerate(self.evaluations)}
+                self.evaluated_test_ids = set(self._eval_index)
 
                 print(f"✅ Loaded {len(self.evaluations)} existing evaluations")
                 print(f"   Already evaluated: {sorted(self.evaluated_test_ids)}")
-            except Exception as e:
+            except (OSError, ValueError, KeyError, TypeError) as e:
                 print(f"⚠️  Could not load existing evaluations: {e}")
                 self.evaluations = []
                 self.evaluated_test_ids = set()
+                self._eval_index = {}
+
+        self._replay_append_log()
+
+    _PKL_FILE = Path("results/evaluations.pkl")
+
+    def _read_eval_sidecar(self, eval_file: Path):
+        """Return the pickled evaluations, or None when stale or absent"""
+        try:
+            if self._PKL_FILE.stat().st_mtime_ns < eval_file.stat().st_mtime_ns:
+                return None
+            with open(self._PKL_FILE, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def _replay_append_log(self):
+        """Fold pending JSONL lines from a previous session into memory
+
+        For duplicated test_ids the last line wins. The canonical file is
+        rewritten right away so anything reading evaluations.json directly
+        stays in sync.
+        """
+        if not self._JSONL_FILE.exists():
+            return
+
+        replayed = 0
+        for line in self._JSONL_FILE.read_bytes().splitlines():
+            if not line.strip():
+                continue
+            try:
+                evaluation = _load_json_bytes(line)
+            except ValueError:
+                continue  # torn tail line from an interrupted write
+            test_id = evaluation.get("test_id")
+            if not test_id:
+                continue
+            idx = self._eval_index.get(test_id)
+            if idx is not None:
+                self.evaluations[idx] = evaluation
+            else:
+                self._eval_index[test_id] = len(self.evaluations)
+                self.evaluations.append(evaluation)
+            self.evaluated_test_ids.add(test_id)
+            replayed += 1
+
+        if replayed:
+            print(f"🔁 Recovered {replayed} evaluation(s) from the append log")
+        self._compact_evaluations()
 
     def get_current_test(self) -> Optional[Dict]:
         """Get the current test case"""
@@ -162,9 +341,9 @@ class EvaluationInterface:
             if not latency_str or latency_str == "N/A":
                 return None
             try:
-                # Extract just the number part before 's'
-                return float(latency_str.split('s')[0])
-            except:
+                # Slice up to the 's' - no intermediate split list
+                return float(latency_str[:latency_str.index('s')])
+            except ValueError:
                 return None
 
         cartesia_latency = parse_latency(cartesia_latency_display)
@@ -210,32 +389,80 @@ class EvaluationInterface:
             }
         }
 
+        # Drop any memoized display for this test - its scores just changed
+        self._display_cache.pop((test_id, True), None)
+        self._display_cache.pop((test_id, False), None)
+
+        # Retire the test from the sorted to-do list
+        idx = self._test_id_to_idx.get(test_id)
+        if idx is not None:
+            pos = bisect.bisect_left(self._unevaluated_indices, idx)
+            if pos < len(self._unevaluated_indices) and self._unevaluated_indices[pos] == idx:
+                del self._unevaluated_indices[pos]
+
         # Check if this test was already evaluated (update vs new)
-        existing_idx = None
-        for i, e in enumerate(self.evaluations):
-            if e["test_id"] == test_id:
-                existing_idx = i
-                break
+        existing_idx = self._eval_index.get(test_id)
 
         if existing_idx is not None:
             # Update existing evaluation
             self.evaluations[existing_idx] = evaluation
             self.evaluated_test_ids.add(test_id)
-            self._save_evaluations()
+            self._append_evaluation(evaluation)
             return f"✅ Updated evaluation for {test_id}"
         else:
             # New evaluation
+            self._eval_index[test_id] = len(self.evaluations)
             self.evaluations.append(evaluation)
             self.evaluated_test_ids.add(test_id)
-            self._save_evaluations()
+            self._append_evaluation(evaluation)
             return f"✅ Saved evaluation for {test_id}"
 
+    _JSONL_FILE = Path("results/evaluations.jsonl")
+    _COMPACT_EVERY = 10  # saves between rewrites of the canonical file
+
+    def _append_evaluation(self, evaluation: Dict):
+        """Persist one evaluation as a single appended JSONL line
+
+        Rewriting the whole evaluations.json per slider save is O(N) in
+        evaluations; appending one line is O(1). The canonical file is
+        recompacted every few saves and on every launch, so downstream
+        readers (the analyzers) always find it current.
+        """
+        if orjson is not None:
+            line = orjson.dumps(evaluation) + b"\n"
+        else:
+            line = json.dumps(evaluation).encode() + b"\n"
+        with open(self._JSONL_FILE, 'ab') as f:
+            f.write(line)
+
+        self._saves_since_compact += 1
+        if self._saves_since_compact >= self._COMPACT_EVERY:
+            self._compact_evaluations()
+
+    def _compact_evaluations(self):
+        """Fold the append log back into the canonical evaluations.json"""
+        self._save_evaluations()
+        self._JSONL_FILE.unlink(missing_ok=True)
+        self._saves_since_compact = 0
+
     def _save_evaluations(self):
         """Save evaluations to JSON file"""
         output_file = Path("results/evaluations.json")
 
-        with open(output_file, 'w') as f:
-            json.dump(self.evaluations, f, indent=2)
+        if orjson is not None:
+            output_file.write_bytes(
+                orjson.dumps(self.evaluations, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(self.evaluations, f, indent=2)
+
+        # Refresh the fast-reload sidecar after the canonical file so its
+        # mtime stays >= the JSON's
+        try:
+            with open(self._PKL_FILE, "wb") as f:
+                pickle.dump(self.evaluations, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # sidecar is best-effort
 
     def next_test(self):
         """Move to next test case"""
@@ -251,17 +478,34 @@ class EvaluationInterface:
             self.current_index = 0
         return self._update_display()
 
+    def _build_test_indexes(self):
+        """Precompute dropdown data once after test cases load
+
+        The dropdown callbacks fire on every UI interaction; the id/category
+        pairs never change, so only the status emoji is substituted per
+        event and jumps resolve through a dict instead of a scan.
+        """
+        self._test_id_to_idx = {t["test_id"]: i for i, t in enumerate(self.test_cases)}
+        self._choices_by_category = {}
+        for test in self.test_cases:
+            self._choices_by_category.setdefault(test["category"], []).append(
+                (test["test_id"], test["category"]))
+        self._categories = sorted(self._choices_by_category)
+        self._unevaluated_indices = [
+            i for i, t in enumerate(self.test_cases)
+            if t["test_id"] not in self.evaluated_test_ids]
+
+    def _format_choices(self, pairs):
+        """Render (test_id, category) pairs with the current status emoji"""
+        evaluated = self.evaluated_test_ids
+        # Format: "E1-H1 ✅ - heteronyms"
+        return [f"{test_id} {'✅' if test_id in evaluated else '⏳'} - {category}"
+                for test_id, category in pairs]
+
     def _get_test_choices(self):
         """Get formatted test choices for dropdown"""
-        choices = []
-        for i, test in enumerate(self.test_cases):
-            test_id = test["test_id"]
-            category = test["category"]
-            status = "✅" if test_id in self.evaluated_test_ids else "⏳"
-            # Format: "E1-H1 ✅ - heteronyms"
-            choice = f"{test_id} {status} - {category}"
-            choices.append(choice)
-        return choices
+        return self._format_choices(
+            (t["test_id"], t["category"]) for t in self.test_cases)
 
     def jump_to_test(self, choice):
         """Jump to a specific test by dropdown selection"""
@@ -271,28 +515,21 @@ class EvaluationInterface:
         # Extract test_id from choice (format: "E1-H1 ✅ - heteronyms")
         test_id = choice.split()[0]
 
-        # Find index
-        for i, test in enumerate(self.test_cases):
-            if test["test_id"] == test_id:
-                self.current_index = i
-                break
+        idx = self._test_id_to_idx.get(test_id)
+        if idx is not None:
+            self.current_index = idx
 
         return self._update_display()
 
     def jump_to_unevaluated(self):
         """Jump to next unevaluated test case"""
-        # Find first unevaluated test from current position
-        start_idx = self.current_index
-        for i in range(start_idx, len(self.test_cases)):
-            if self.test_cases[i]["test_id"] not in self.evaluated_test_ids:
-                self.current_index = i
-                return self._update_display()
-
-        # Wrap around - check from beginning
-        for i in range(0, start_idx):
-            if self.test_cases[i]["test_id"] not in self.evaluated_test_ids:
-                self.current_index = i
-                return self._update_display()
+        # _unevaluated_indices stays sorted, so "first at or after the
+        # current position, wrapping" is one bisect instead of rescanning
+        # every completed test on each click
+        remaining = self._unevaluated_indices
+        if remaining:
+            pos = bisect.bisect_left(remaining, self.current_index)
+            self.current_index = remaining[pos] if pos < len(remaining) else remaining[0]
 
         # All evaluated - stay at current
         return self._update_display()
@@ -302,23 +539,13 @@ class EvaluationInterface:
         if category == "All":
             return gr.Dropdown(choices=self._get_test_choices())
 
-        # Filter choices by category
-        filtered_choices = []
-        for i, test in enumerate(self.test_cases):
-            if test["category"] == category:
-                test_id = test["test_id"]
-                status = "✅" if test_id in self.evaluated_test_ids else "⏳"
-                choice = f"{test_id} {status} - {category}"
-                filtered_choices.append(choice)
-
-        return gr.Dropdown(choices=filtered_choices)
+        return gr.Dropdown(choices=self._format_choices(
+            self._choices_by_category.get(category, [])))
 
     def _get_existing_evaluation(self, test_id: str) -> Optional[Dict]:
         """Get existing evaluation for a test ID"""
-        for evaluation in self.evaluations:
-            if evaluation["test_id"] == test_id:
-                return evaluation
-        return None
+        idx = self._eval_index.get(test_id)
+        return self.evaluations[idx] if idx is not None else None
 
     def _update_display(self):
         """Update the display with current test case"""
@@ -328,25 +555,36 @@ class EvaluationInterface:
             # Return defaults for all fields (22 fields total)
             return ["No test cases loaded"] + [""] * 21
 
-        # Show progress with evaluation status
+        # The outputs only change when the test's evaluation does, so one
+        # built list is replayed for repeat visits; save_evaluation drops
+        # the stale key for the test it touched
         is_evaluated = test["test_id"] in self.evaluated_test_ids
+        cache_key = (test["test_id"], is_evaluated)
+        cached = self._display_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Show progress with evaluation status
         status = "✅ DONE" if is_evaluated else "⏳ TODO"
         progress = f"Test {self.current_index + 1}/{len(self.test_cases)} - {test['test_id']} [{status}]"
 
-        # Format latency displays
-        c_latency = test.get("cartesia_latency")
-        e_latency = test.get("elevenlabs_latency")
+        # Format latency displays once per test and keep them on the dict
+        c_latency_str = test.get("_c_latency_str")
+        e_latency_str = test.get("_e_latency_str")
+        if c_latency_str is None:
+            c_latency = test.get("cartesia_latency")
+            e_latency = test.get("elevenlabs_latency")
+
+            c_latency_str = f"{c_latency:.2f}s" if c_latency else "N/A"
+            e_latency_str = f"{e_latency:.2f}s" if e_latency else "N/A"
 
-        c_latency_str = f"{c_latency:.2f}s" if c_latency else "N/A"
-        e_latency_str = f"{e_latency:.2f}s" if e_latency else "N/A"
+            # Add speed comparison
+            if c_latency and e_latency:
+                c_latency_str += f" {'✅' if c_latency < e_latency else '⏱️'}"
+                e_latency_str += f" {'✅' if e_latency < c_latency else '⏱️'}"
 
-        # Add speed comparison
-        if c_latency and e_latency:
-            diff = abs(c_latency - e_latency)
-            faster = "Cartesia" if c_latency < e_latency else "Eleven Labs"
-            speedup = max(c_latency, e_latency) / min(c_latency, e_latency)
-            c_latency_str += f" {'✅' if c_latency < e_latency else '⏱️'}"
-            e_latency_str += f" {'✅' if e_latency < c_latency else '⏱️'}"
+            test["_c_latency_str"] = c_latency_str
+            test["_e_latency_str"] = e_latency_str
 
         # Check if this test has been evaluated before
         existing_eval = self._get_existing_evaluation(test["test_id"]) if is_evaluated else None
@@ -357,7 +595,7 @@ class EvaluationInterface:
             elev = existing_eval["elevenlabs"]
             comp = existing_eval["comparison"]
 
-            return [
+            outputs = [
                 progress,
                 test["test_id"],
                 test["text"],
@@ -365,8 +603,8 @@ class EvaluationInterface:
                 test.get("expected_challenges", []),
                 c_latency_str,
                 e_latency_str,
-                test["cartesia_audio"] if test["has_cartesia"] else None,
-                test["elevenlabs_audio"] if test["has_elevenlabs"] else None,
+                test["cartesia_audio_or_none"],
+                test["elevenlabs_audio_or_none"],
                 f"Category: {test['category']}\nImportance: {test.get('importance', 'N/A')}",
                 # Cartesia scores (pre-filled from existing evaluation)
                 cart["pronunciation_accuracy"],
@@ -388,7 +626,7 @@ class EvaluationInterface:
             ]
         else:
             # Return defaults for new evaluation
-            return [
+            outputs = [
                 progress,
                 test["test_id"],
                 test["text"],
@@ -396,8 +634,8 @@ class EvaluationInterface:
                 test.get("expected_challenges", []),
                 c_latency_str,
                 e_latency_str,
-                test["cartesia_audio"] if test["has_cartesia"] else None,
-                test["elevenlabs_audio"] if test["has_elevenlabs"] else None,
+                test["cartesia_audio_or_none"],
+                test["elevenlabs_audio_or_none"],
                 f"Category: {test['category']}\nImportance: {test.get('importance', 'N/A')}",
                 # Default scores (all 3s)
                 3, 3, 3, 3, 3, "",  # Cartesia
@@ -405,6 +643,9 @@ class EvaluationInterface:
                 "Tie", ""  # Comparison
             ]
 
+        self._display_cache[cache_key] = outputs
+        return outputs
+
     def create_interface(self) -> gr.Blocks:
         """Create the Gradio interface"""
 
@@ -521,7 +762,7 @@ class EvaluationInterface:
                     )
                 with gr.Column():
                     category_filter = gr.Dropdown(
-                        choices=["All"] + sorted(list(set(t["category"] for t in self.test_cases))),
+                        choices=["All"] + self._categories,
                         value="All",
                         label="Filter by Category",
                         interactive=True
@@ -658,6 +899,7 @@ class EvaluationInterface:
         """Launch the evaluation interface"""
         print("Loading test cases...")
         self.test_cases = self.load_test_cases(language)
+        self._build_test_indexes()
 
         if not self.test_cases:
             print(f"⚠️  No test cases with generated audio found for {language}")
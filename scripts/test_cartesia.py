@@ -3,28 +3,35 @@ Test Cartesia API with different configurations
 """
 
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
+import yaml
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# One keep-alive session for every probe: the TLS handshake and DNS
+# lookup happen once instead of per model tested
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+SESSION.headers.update({
+    "X-API-Key": os.getenv("CARTESIA_API_KEY"),
+    "Cartesia-Version": "2024-06-10",
+    "Content-Type": "application/json"
+})
+
+
 def test_cartesia(model_id, voice_id, text="Hello, this is a test of the Cartesia text to speech system."):
     """Test Cartesia API with specific configuration"""
 
-    api_key = os.getenv("CARTESIA_API_KEY")
-
     print(f"\n{'='*60}")
     print(f"Testing: {model_id}")
     print(f"Voice: {voice_id}")
     print(f"Text: {text}")
     print(f"{'='*60}")
 
-    headers = {
-        "X-API-Key": api_key,
-        "Cartesia-Version": "2024-06-10",
-        "Content-Type": "application/json"
-    }
-
     payload = {
         "model_id": model_id,
         "transcript": text,
@@ -41,21 +48,31 @@ def test_cartesia(model_id, voice_id, text="Hello, this is a test of the Cartesi
 
     try:
         print("Sending request...")
-        response = requests.post(
+        start_time = time.time()
+        response = SESSION.post(
             "https://api.cartesia.ai/tts/bytes",
-            headers=headers,
             json=payload,
-            timeout=30
+            timeout=30,
+            stream=True
         )
 
         print(f"Status: {response.status_code}")
 
         if response.status_code == 200:
             filename = f"outputs/cartesia/test_{model_id.replace('-', '_')}.mp3"
-            with open(filename, 'wb') as f:
-                f.write(response.content)
+            # Stream chunks straight to disk - the MP3 is never held in
+            # memory, and the first chunk gives a real TTFB reading
+            ttfb = None
+            size = 0
+            with open(filename, 'wb', buffering=1 << 20) as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    if ttfb is None:
+                        ttfb = time.time() - start_time
+                    f.write(chunk)
+                    size += len(chunk)
             print(f"✅ Success! Saved to: {filename}")
-            print(f"File size: {len(response.content)} bytes")
+            print(f"TTFB: {ttfb:.3f}s" if ttfb is not None else "TTFB: n/a")
+            print(f"File size: {size} bytes")
             return True
         else:
             print(f"❌ Error: {response.status_code}")
@@ -69,7 +86,6 @@ def test_cartesia(model_id, voice_id, text="Hello, this is a test of the Cartesi
 
 if __name__ == "__main__":
     # Get voice ID from config
-    import yaml
     with open("config.yaml") as f:
         config = yaml.safe_load(f)
 
@@ -84,9 +100,10 @@ if __name__ == "__main__":
         "sonic",
     ]
 
-    for model in models_to_test:
-        test_cartesia(model, voice_id)
-        print()
+    # The probes are independent network calls - run them side by side
+    # on the shared session instead of waiting out each TTFB in turn
+    with ThreadPoolExecutor(max_workers=len(models_to_test)) as pool:
+        list(pool.map(lambda model: test_cartesia(model, voice_id), models_to_test))
 
     print("\n💡 Listen to the test files and see which sounds best!")
     print("   Files are in: outputs/cartesia/test_*.mp3")